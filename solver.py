@@ -30,11 +30,20 @@ class DPLL:
         self.dlis = dlis
         self.clause_list = clause_list
         self.satisfied_clauses = set()
-        self.forced_decision_queue = list()
         self.num_clauses = len(clause_list)
 
-        self.free_decision_list = list()  # Keep track of free decisions for backtracking
-        self.all_decisions_list = list()  # Keep track of free AND forced decisions for backtracking
+        # Trail of free AND forced decisions in the order they were assigned
+        self.trail = list()
+        # Stack of trail indices where each decision level (free decision + its forced decisions) starts
+        self.trail_lim = list()
+        # Propagation head: trail entries before this index have been set, entries after it are queued forces
+        self.prop_head = 0
+        # Set of assigned literals for constant time lookups, mirrors the trail
+        self.assigned_literals = set()
+        # Per-variable decision level (-1 if unassigned) and reason (index of forcing clause, None if free decision)
+        self.level = [-1] * (numvars + 1)
+        self.reason = [None] * (numvars + 1)
+
         self.all_variables = set(range(1, numvars + 1))
         self.SATISFIED = False
         self.UNSATISFIABLE = False
@@ -54,7 +63,7 @@ class DPLL:
 
         # Check if this DPLL has been determined to be UNSAT, or SAT
         if result == DECISION_CAUSES_SAT:
-            return self.all_decisions_list, SOLVED_SAT
+            return self.trail, SOLVED_SAT
 
         elif result == DECISION_CAUSES_CONFLICT:
             return None, SOLVED_UNSAT
@@ -66,6 +75,29 @@ class DPLL:
     # END OF SOLVE FUNCTION
     ###################################################################################
 
+    ###################################################################################
+    # TRAIL FUNCTIONS - Record and remove assignments on the trail
+    ###################################################################################
+
+    def assign(self, assignment, reason):
+        # Push assignment onto the trail at the current decision level
+        var = abs(assignment)
+        self.trail.append(assignment)
+        self.assigned_literals.add(assignment)
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+
+    def unassign(self, assignment):
+        # Clear the assignment's entry in the per-variable arrays, the caller truncates the trail
+        var = abs(assignment)
+        self.assigned_literals.remove(assignment)
+        self.level[var] = -1
+        self.reason[var] = None
+
+    ###################################################################################
+    # END OF TRAIL FUNCTIONS
+    ###################################################################################
+
     ###################################################################################
     # BACKTRACKING FUNCTION - Backtrack to last free decision
     ###################################################################################
@@ -74,32 +106,28 @@ class DPLL:
         # Change CONFLICT back to false
         self.CONFLICT = False
 
-        # If there are no free decisions in the self.free_decision_list, that means the function is Unsatisfiable
+        # If there are no decision levels on the trail, that means the function is Unsatisfiable
         # We have already backtracked to all our free decisions and still found conflict
-        if not self.free_decision_list:
+        if not self.trail_lim:
             self.UNSATISFIABLE = True
             return 0
 
-        # Get most recent free decision from self.free_decision_list
-        last_free_decision = self.free_decision_list[-1]
+        # Pop the most recent decision level, so we don't backtrack to the same place twice
+        # The last free decision sits at the start of its level, followed by any forced decisions that occurred
+        level_start = self.trail_lim.pop()
+        undone = self.trail[level_start:]
+        del self.trail[level_start:]
 
-        # Go through and UNSET the last free decision AND any forced decisions that occurred
+        # Unassign the whole level first so clauses are checked against the trail before the last free decision
+        for assignment in undone:
+            self.unassign(assignment)
 
-        # To do so, find last_free_decision in the all_decisions_list and iterate from there
-        free_decision_index = self.all_decisions_list.index(last_free_decision)
-        end_index = len(self.all_decisions_list)
-        for i in range(free_decision_index, end_index):
-            # Unset variable in clauses
-            self.unset(self.all_decisions_list[i], free_decision_index)
-
-        # Remove all decisions from last free decision onward from all_decisions_list
-        self.all_decisions_list = self.all_decisions_list[0:free_decision_index]
-
-        # Remove that free decision from the free_decision_list, so we don't backtrack to the same place twice
-        self.free_decision_list.pop()
+        # Go through and UNSET the last free decision AND any forced decisions that occurred
+        for assignment in undone:
+            self.unset(assignment)
 
-        # Empty the forced_decision_queue as those forced decisions no longer need to be enforced
-        self.forced_decision_queue.clear()
+        # Queued forced decisions were part of the undone level, move the propagation head back with the trail
+        self.prop_head = level_start
 
         return
 
@@ -112,36 +140,17 @@ class DPLL:
     ###################################################################################
 
     def do_forced_decisions(self):
-        # If we have forced decisions in the forced_decision_queue that we haven't forced, then call a forced decision
-
-        start = 0
-        last_seen = len(self.forced_decision_queue)
-
-        while last_seen - start > 0:
-            last_seen = len(self.forced_decision_queue)
-            # Get next literal to force ...
-            next_forces = self.forced_decision_queue[start:last_seen]
-            start = last_seen
-
-            for force in next_forces:
-                # If we are trying to set the complement of a previous choice, we must return: Bad path.
-                if force * -1 in self.all_decisions_list:
-                    return FORCE_CAUSES_CONFLICT
-
-                if force not in self.all_decisions_list:
-                    self.all_decisions_list.append(force)
-                    set_result = self.set(force)
-
-                    # Setting didn't work out, let's go back
-                    if set_result == SET_CAUSES_CONFLICT:
-                        return FORCE_CAUSES_CONFLICT
+        # Forced decisions are queued on the trail by set, everything past the propagation head hasn't been set yet
+        # Setting a forced decision may queue further forced decisions, so keep going until the head reaches the end
+        while self.prop_head < len(self.trail):
+            force = self.trail[self.prop_head]
+            self.prop_head += 1
 
-            # Update our pointer to try any subsequent forces
-            last_seen = len(self.forced_decision_queue)
+            set_result = self.set(force)
 
-        # Remove entries from our queue, we've just set them
-        if start > 0:
-            del self.forced_decision_queue[0:]
+            # Setting didn't work out, let's go back
+            if set_result == SET_CAUSES_CONFLICT:
+                return FORCE_CAUSES_CONFLICT
 
         return FORCE_NORMAL
 
@@ -162,9 +171,10 @@ class DPLL:
         outcome = dict()
 
         for decision in decisions:
-            # Add this decision to the free decision list ...
-            self.free_decision_list.append(decision)
-            self.all_decisions_list.append(decision)
+            # Start a new decision level on the trail with this decision ...
+            self.trail_lim.append(len(self.trail))
+            self.assign(decision, None)
+            self.prop_head = len(self.trail)
 
             # Use set function to assign variable
             set_result = self.set(decision)
@@ -235,7 +245,7 @@ class DPLL:
             return 0
 
         # Get a list of the unassigned literals
-        assigned_vars = {abs(x) for x in self.all_decisions_list}
+        assigned_vars = {abs(x) for x in self.trail}
         unassigned_vars = self.all_variables.difference(assigned_vars)
 
         # Check if all variables are assigned, return 0 if so
@@ -282,7 +292,7 @@ class DPLL:
                 clause = self.clause_list[index]
 
                 # Try to update the watch variable. Result could be normal, one left, SAT, or conflict
-                set_result = clause.watch_var_update(self.all_decisions_list, self.dlis)
+                set_result = clause.watch_var_update(self.assigned_literals, self.dlis)
 
                 # No unit clause, conflict, or SAT: update watch variables
                 if set_result == CLAUSE_NORMAL:
@@ -303,15 +313,14 @@ class DPLL:
 
                     continue
 
-                # Unit clause: Add the remaining literal to the forced decision queue
+                # Unit clause: Queue the remaining literal as a forced decision on the trail
                 elif set_result == CLAUSE_ONE_LEFT:
                     remainder = clause.last_literal
                     complement = remainder * -1
 
-                    if complement in self.all_decisions_list or complement in self.forced_decision_queue:
+                    if complement in self.assigned_literals:
                         return SET_CAUSES_CONFLICT
-                    self.forced_decision_queue.append(remainder)  # Get the single remaining literal
-                    pass
+                    self.assign(remainder, index)  # Forced by this clause, set later by do_forced_decisions
 
                 # SAT clause: add clause to satisfied clauses attribute
                 elif set_result == CLAUSE_SAT:
@@ -331,7 +340,7 @@ class DPLL:
     # UNSET FUNCTION - Check if clauses watching backtracked assignments are no longer
     # SAT and remove from SAT list
     ###################################################################################
-    def unset(self, assignment, dec_list_end_index):
+    def unset(self, assignment):
         # If a clause got satisfied by one of the decisions we are backtracking, that decision was one of that
         # clause's watch variables and the watch variable hasn't been updated, so watch_presence for the literal finds
         # the clauses of interest, then we only need to check the SAT clauses to see if they are now UNRES
@@ -351,7 +360,7 @@ class DPLL:
 
                 clause = self.clause_list[index]
                 # check if the clause is still satisfied according to our updated decisions list
-                check_sat_result = clause.check_sat(assignment, self.all_decisions_list[0:dec_list_end_index], self.dlis)
+                check_sat_result = clause.check_sat(assignment, self.assigned_literals, self.dlis)
 
                 # If clause is no longer SAT: remove from satisfied clause list
                 if check_sat_result == UNSET_CAUSES_UNRES:
@@ -116,8 +116,8 @@ def make_clause_list(list_of_expressions):
 
 
 # Clause object: consists of its status, terms, and watch variables. Has methods for updating watch variables given
-# the decision list (used when setting an assignment watched by the clause) and for checking SAT (used when unsetting
-# an assignment watched by the clause during backtracking)
+# the assigned literals (used when setting an assignment watched by the clause) and for checking SAT (used when
+# unsetting an assignment watched by the clause during backtracking)
 class Clause:
     def __init__(self, terms):
         # State
@@ -140,10 +140,8 @@ class Clause:
         # Last literal for when clause has one literal left
         self.last_literal = None
 
-    # Method for updating watch variables based on latest decisions list
-    def watch_var_update(self, decisions_list, dlis):
-        # Convert list to set for set methods
-        decisions_set = set(decisions_list)
+    # Method for updating watch variables based on the set of currently assigned literals
+    def watch_var_update(self, decisions_set, dlis):
 
         # If there are clause terms that are satisfied, update DLIS and return CLAUSE_SAT
         sat_terms = self.terms.intersection(decisions_set)
@@ -176,11 +174,9 @@ class Clause:
 
             return CLAUSE_NORMAL
 
-    # Method for checking if the clause is still satisfied given the latest backtracked decisions list
-    def check_sat(self, assignment, decisions_list, dlis):
+    # Method for checking if the clause is still satisfied given the set of literals assigned after backtracking
+    def check_sat(self, assignment, decisions_set, dlis):
 
-        # Convert decisions list to set for set methods
-        decisions_set = set(decisions_list)
         # Check if any of the clause terms are satisfied by the current decisions
         sat_terms = self.terms.intersection(decisions_set)
 